@@ -1,15 +1,18 @@
+from array import array
 from collections import deque, namedtuple
 from enum import Enum
+from itertools import islice
 from pathlib import Path
 from random import randrange
-from typing import Deque, List
+from typing import Deque, Dict, Iterator, List, Optional, Sequence, Tuple
 
 import pygame
 import pygame_menu
 
 
-GameLog = namedtuple('GameLog', 'snake_direction, snake_parts, food')
 GameArea = namedtuple('GameArea', 'left, top, width, height')
+GameSounds = namedtuple('GameSounds', 'reverse, food, fail')
+Palette = namedtuple('Palette', 'background, snake_head, snake_tail, food, bar_background, reverse_bar, text')
 
 
 class Snake:
@@ -21,22 +24,36 @@ class Snake:
         LEFT = (-1, 0)
         RIGHT = (1, 0)
 
-    parts: List[pygame.Rect]
+    OPPOSITE_DIRECTIONS = {
+        Direction.UP: Direction.DOWN,
+        Direction.DOWN: Direction.UP,
+        Direction.LEFT: Direction.RIGHT,
+        Direction.RIGHT: Direction.LEFT,
+    }
+
+    parts: Deque[pygame.Rect]
+    _occupied: Dict[Tuple[int, int], int]
 
     def __init__(self, start_x: int, start_y: int, tail_length: int = 0):
         self.direction = self.Direction.LEFT
-        self.parts = [pygame.Rect(start_x, start_y, self.PART_SIZE, self.PART_SIZE)]
+        self.parts = deque([pygame.Rect(start_x, start_y, self.PART_SIZE, self.PART_SIZE)])
+        self.vacated = pygame.Rect(start_x, start_y, self.PART_SIZE, self.PART_SIZE)  # place left by the last move
+        # grid cells covered by the tail, mapped to the number of parts in them (parts overlap after growth):
+        self._occupied = {}
         for _ in range(tail_length):
             self.increase()
 
-    def has_collisions(self, game_are: GameArea) -> bool:
+    def has_collisions(self, left: int, top: int, right: int, bottom: int) -> bool:
+        """Checks if the head is out of given bounds or bumped into the tail."""
         head = self.head
+        x, y = head.x, head.y
+        size = self.PART_SIZE
         return (
-                head.left < game_are.left
-                or head.right > game_are.left + game_are.width
-                or head.top < game_are.top
-                or head.bottom > game_are.top + game_are.height
-                or any(head.colliderect(part) for part in self.tail)
+                x < left
+                or x + size > right
+                or y < top
+                or y + size > bottom
+                or (x // size, y // size) in self._occupied
         )
 
     def increase(self) -> None:
@@ -44,110 +61,185 @@ class Snake:
         size = self.PART_SIZE
         new_part = pygame.Rect(part.left, part.top, size, size)
         self.parts.append(new_part)
+        self._occupy(self.get_cell(new_part))
+
+    def restore(self, positions: Sequence[int]) -> None:
+        """
+        Move all snake parts to given positions, starting from the head.
+
+        Positions are flat pairs of coordinates: left and top of the first part, then of the second one, etc.
+        Existing parts are reused, so only a changed snake length leads to adding or removing of parts.
+        """
+        parts = self.parts
+        length = len(positions) // 2
+        while len(parts) > length:
+            parts.pop()
+        while len(parts) < length:
+            parts.append(pygame.Rect(0, 0, self.PART_SIZE, self.PART_SIZE))
+
+        coordinates = iter(positions)
+        for part, left, top in zip(parts, coordinates, coordinates):
+            part.x = left
+            part.y = top
+
+        self._occupied.clear()
+        for part in self.tail:
+            self._occupy(self.get_cell(part))
 
     def move(self) -> None:
-        for i in range(len(self.tail), 0, -1):
-            previous_part = self.parts[i - 1]
-            current_part = self.parts[i]
-            current_part.x = previous_part.x
-            current_part.y = previous_part.y
+        if len(self.parts) > 1:  # the last part leaves its cell, the head one becomes a tail cell
+            self._release(self.get_cell(self.parts[-1]))
+            self._occupy(self.get_cell(self.head))
 
+        # instead of shifting every part, the last one is reused as a new head:
         x_dir, y_dir = self.direction.value
         head = self.head
-        head.move_ip(x_dir * head.width, y_dir * head.height)
-
-    def turn_up(self) -> None:
-        if self.direction != self.Direction.DOWN:
-            self.direction = self.Direction.UP
+        new_head = self.parts.pop()
+        self.vacated.x = new_head.x
+        self.vacated.y = new_head.y
+        new_head.x = head.x + x_dir * self.PART_SIZE
+        new_head.y = head.y + y_dir * self.PART_SIZE
+        self.parts.appendleft(new_head)
 
-    def turn_down(self) -> None:
-        if self.direction != self.Direction.UP:
-            self.direction = self.Direction.DOWN
-
-    def turn_left(self) -> None:
-        if self.direction != self.Direction.RIGHT:
-            self.direction = self.Direction.LEFT
-
-    def turn_right(self) -> None:
-        if self.direction != self.Direction.LEFT:
-            self.direction = self.Direction.RIGHT
+    def occupies(self, cell: Tuple[int, int]) -> bool:
+        return cell in self._occupied or cell == self.get_cell(self.head)
 
     @property
     def head(self) -> pygame.Rect:
         return self.parts[0]
 
     @property
-    def tail(self) -> List[pygame.Rect]:
-        return self.parts[1:]
+    def tail(self) -> Iterator[pygame.Rect]:
+        """Iterates over the parts behind the head without copying them."""
+        return islice(self.parts, 1, None)
+
+    @classmethod
+    def get_cell(cls, part: pygame.Rect) -> Tuple[int, int]:
+        return part.x // cls.PART_SIZE, part.y // cls.PART_SIZE
+
+    def _occupy(self, cell: Tuple[int, int]) -> None:
+        self._occupied[cell] = self._occupied.get(cell, 0) + 1
+
+    def _release(self, cell: Tuple[int, int]) -> None:
+        count = self._occupied[cell] - 1
+        if count:
+            self._occupied[cell] = count
+        else:
+            del self._occupied[cell]
+
+
+class GameLog:
+    """State of a game at one frame. Instances are reused, so a new frame overwrites an old log."""
+
+    def __init__(self):
+        self.snake_direction = Snake.Direction.LEFT
+        self.snake_parts = array('i')  # flat pairs of left and top coordinates of the snake parts
+        self.food_left = 0
+        self.food_top = 0
 
 
 class GameSession:
     LOG_LIMIT = 25
-    FOOD_SIZE = 20
+    FOOD_SIZE = Snake.PART_SIZE  # food takes exactly one cell of the snake grid
     SNAKE_START_LENGTH = 3
 
     REVERT_SOUND_ID = 5
     FOOD_SOUND_ID = 6
     FAIL_SOUND_ID = 7
+    FOOD_SOUND_END_EVENT = pygame.event.custom_type()
 
-    logs: Deque[GameLog]
+    KEY_DIRECTIONS = {
+        pygame.K_UP: Snake.Direction.UP,
+        pygame.K_DOWN: Snake.Direction.DOWN,
+        pygame.K_LEFT: Snake.Direction.LEFT,
+        pygame.K_RIGHT: Snake.Direction.RIGHT,
+    }
 
-    def __init__(self, game_area: GameArea, frame_time: int, is_predictable_future: bool):
+    _logs: List[GameLog]
+
+    def __init__(self, game_area: GameArea, frame_time: int, is_predictable_future: bool, sounds: GameSounds):
         self.area = game_area
+        self._right_bound = game_area.left + game_area.width
+        self._bottom_bound = game_area.top + game_area.height
+        self._grid_columns = game_area.width // Snake.PART_SIZE
+        self._grid_rows = game_area.height // Snake.PART_SIZE
         self._frame_time = frame_time  # in milliseconds
 
         self.is_running = True
-        self.logs = deque(maxlen=self.LOG_LIMIT)
+        # ring buffer of logs, the latest one is at `_last_log_index`:
+        self._logs = [GameLog() for _ in range(self.LOG_LIMIT)]
+        self._last_log_index = -1
+        self._logs_count = 0
         self.is_reversed = False
-        self._last_full_revert = pygame.time.get_ticks()
+        self._is_reverse_key_held = False
+        self._now = pygame.time.get_ticks()  # time of the current frame, in milliseconds
+        self._last_full_revert = self._now
         self._is_predictable_future = is_predictable_future
-        self._next_foods = []
+        # positions of foods to appear again, a food eaten more than LOG_LIMIT frames ago can't be turned back:
+        self._next_foods = deque(maxlen=self.LOG_LIMIT)
 
-        start_left = game_area.left + ((game_area.width / 2) // Snake.PART_SIZE) * Snake.PART_SIZE
-        start_top = game_area.top + ((game_area.height / 2) // Snake.PART_SIZE) * Snake.PART_SIZE
+        start_left = game_area.left + (game_area.width // 2 // Snake.PART_SIZE) * Snake.PART_SIZE
+        start_top = game_area.top + (game_area.height // 2 // Snake.PART_SIZE) * Snake.PART_SIZE
         self.snake = Snake(start_x=start_left, start_y=start_top, tail_length=self.SNAKE_START_LENGTH - 1)
         self.food = self.generate_food()
 
-        sounds_directory = Path(__file__).parent / 'sounds'
-        self._reverse_sound = pygame.mixer.Sound(str(sounds_directory / 'tape_rewind.ogg'))
-        self._food_sound = pygame.mixer.Sound(str(sounds_directory / 'profit.wav'))
-        self._fail_sound = pygame.mixer.Sound(str(sounds_directory / 'fail.wav'))
+        self._sounds = sounds
+
+        # channels state is tracked here, so it's not requested from the mixer every frame:
+        self._reverse_channel = pygame.mixer.Channel(self.REVERT_SOUND_ID)
+        self._food_channel = pygame.mixer.Channel(self.FOOD_SOUND_ID)
+        self._food_channel.set_endevent(self.FOOD_SOUND_END_EVENT)
+        self._fail_channel = pygame.mixer.Channel(self.FAIL_SOUND_ID)
+        self._is_reverse_sound_playing = False
+        self._is_food_sound_playing = False
 
     def move_snake(self) -> None:
-        pressed_keys = pygame.key.get_pressed()
-        self.is_reversed = pressed_keys[pygame.K_r] and self.logs and not self.is_full_reversed
-        sound_channel = pygame.mixer.Channel(self.REVERT_SOUND_ID)
+        self._now = pygame.time.get_ticks()
+        self.is_reversed = bool(self._is_reverse_key_held and self._logs_count and not self.is_full_reversed)
         if self.is_reversed:
             self._move_backward()
-            if not sound_channel.get_busy():
-                sound_channel.play(self._reverse_sound)
+            if not self._is_reverse_sound_playing:
+                self._reverse_channel.play(self._sounds.reverse, loops=-1)  # lasts until time stops turning back
+                self._is_reverse_sound_playing = True
         else:
-            self._reverse_sound.stop()
-            if sound_channel.get_busy():
-                sound_channel.stop()
+            if self._is_reverse_sound_playing:
+                self._reverse_channel.stop()
+                self._is_reverse_sound_playing = False
             self._move_forward()
 
     def handle_keypress(self, key: int) -> None:
+        if key == pygame.K_r:
+            self._is_reverse_key_held = True
+            return
+
         snake = self.snake
-        handlers = {
-            pygame.K_UP: snake.turn_up,
-            pygame.K_DOWN: snake.turn_down,
-            pygame.K_LEFT: snake.turn_left,
-            pygame.K_RIGHT: snake.turn_right,
-        }
-        handler = handlers.get(key)
-        if handler:
-            handler()
+        direction = self.KEY_DIRECTIONS.get(key)
+        if direction is not None and Snake.OPPOSITE_DIRECTIONS[snake.direction] is not direction:
+            snake.direction = direction
+
+    def handle_food_sound_end(self) -> None:
+        self._is_food_sound_playing = False
+
+    def handle_keyrelease(self, key: int) -> None:
+        if key == pygame.K_r:
+            self._is_reverse_key_held = False
 
     def generate_food(self) -> pygame.Rect:
         size = self.FOOD_SIZE
         area = self.area
         if self._is_predictable_future and self._next_foods:
-            return self._next_foods.pop()
-
-        rand_left = randrange(area.left, area.left + area.width - (size * 2))
-        rand_top = randrange(area.top, area.top + area.height - (size * 2))
-        return pygame.Rect(rand_left, rand_top, size, size)
+            left, top = self._next_foods.pop()
+            return pygame.Rect(left, top, size, size)
+
+        while True:  # the snake covers a small part of the area, so a free cell is found in a few attempts
+            food = pygame.Rect(
+                area.left + randrange(self._grid_columns) * size,
+                area.top + randrange(self._grid_rows) * size,
+                size,
+                size,
+            )
+            if not self.snake.occupies(Snake.get_cell(food)):
+                return food
 
     @property
     def is_full_reversed(self) -> bool:
@@ -156,7 +248,7 @@ class GameSession:
 
         Is used to prevent turning back time when charge is close to zero.
         """
-        return pygame.time.get_ticks() - self._last_full_revert <= (self.LOG_LIMIT * self._frame_time)
+        return self._now - self._last_full_revert <= (self.LOG_LIMIT * self._frame_time)
 
     @property
     def score(self) -> int:
@@ -164,52 +256,64 @@ class GameSession:
 
     @property
     def reverse_percent(self) -> int:
-        return round((len(self.logs) / self.LOG_LIMIT) * 100)
+        return round((self._logs_count / self.LOG_LIMIT) * 100)
 
     def _move_forward(self) -> None:
         snake = self.snake
         snake.move()
 
-        self.is_running = not snake.has_collisions(game_are=self.area)
+        area = self.area
+        self.is_running = not snake.has_collisions(area.left, area.top, self._right_bound, self._bottom_bound)
 
-        if not self.is_running:  # game over
-            sound_channel = pygame.mixer.Channel(self.FAIL_SOUND_ID)
-            if not sound_channel.get_busy():
-                sound_channel.play(self._fail_sound)
+        if not self.is_running:  # game over, happens once per session
+            self._fail_channel.play(self._sounds.fail)
 
-        if self.is_running and snake.head.colliderect(self.food):  # snake eats a food
+        if self.is_running and Snake.get_cell(snake.head) == Snake.get_cell(self.food):  # snake eats a food
             snake.increase()
             self.food = self.generate_food()
-            sound_channel = pygame.mixer.Channel(self.FOOD_SOUND_ID)
-            if not sound_channel.get_busy():
-                sound_channel.play(self._food_sound)
+            if not self._is_food_sound_playing:
+                self._food_channel.play(self._sounds.food)
+                self._is_food_sound_playing = True
 
         self._add_log()
 
     def _move_backward(self) -> None:
-        last_log = self.logs.pop()
-        if not self.logs:  # turning back is completely used
-            self._last_full_revert = pygame.time.get_ticks()
+        last_log = self._logs[self._last_log_index]
+        self._last_log_index = (self._last_log_index - 1) % self.LOG_LIMIT
+        self._logs_count -= 1
+        if not self._logs_count:  # turning back is completely used
+            self._last_full_revert = self._now
 
         self.snake.direction = last_log.snake_direction
-        self.snake.parts = [
-            pygame.Rect(left, top, Snake.PART_SIZE, Snake.PART_SIZE) for left, top in last_log.snake_parts
-        ]
+        self.snake.restore(last_log.snake_parts)
 
-        food = pygame.Rect(last_log.food[0], last_log.food[1], self.FOOD_SIZE, self.FOOD_SIZE)
-        if self._is_predictable_future and food.center != self.food.center:
-            self._next_foods.append(self.food)
-        self.food = food
+        food = self.food
+        if self._is_predictable_future and (food.left != last_log.food_left or food.top != last_log.food_top):
+            self._next_foods.append((food.left, food.top))
+        food.left = last_log.food_left
+        food.top = last_log.food_top
 
     def _add_log(self) -> None:
+        self._last_log_index = (self._last_log_index + 1) % self.LOG_LIMIT
+        self._logs_count = min(self._logs_count + 1, self.LOG_LIMIT)
+
         snake = self.snake
-        self.logs.append(
-            GameLog(
-                snake_direction=snake.direction,
-                snake_parts=tuple((part.left, part.top) for part in snake.parts),
-                food=(self.food.left, self.food.top),
-            )
-        )
+        log = self._logs[self._last_log_index]
+        log.snake_direction = snake.direction
+        # positions are written into the array of the log, which is resized only when the snake length changes:
+        snake_parts = log.snake_parts
+        size = 2 * len(snake.parts)
+        if len(snake_parts) > size:
+            del snake_parts[size:]
+        elif len(snake_parts) < size:
+            snake_parts.frombytes(bytes(snake_parts.itemsize * (size - len(snake_parts))))
+        index = 0
+        for part in snake.parts:
+            snake_parts[index] = part.x
+            snake_parts[index + 1] = part.y
+            index += 2
+        log.food_left = self.food.left
+        log.food_top = self.food.top
 
 
 class GameDifficulty(Enum):
@@ -223,13 +327,64 @@ class GameDifficulty(Enum):
 class Game:
     BORDER_WIDTH, BORDER_HEIGHT = 800, 600
     BAR_SIZE = (Snake.PART_SIZE * 3) - 7
+    BAR_BORDER_SIZE = 4
+    BAR_BORDER_COLOR = pygame.Color("grey")
+    # indexed by the reversed state of a game:
+    PALETTES = (
+        Palette(
+            background=pygame.Color("black"),
+            snake_head=pygame.Color("orange"),
+            snake_tail=pygame.Color("green"),
+            food=pygame.Color("yellow"),
+            bar_background=pygame.Color("white"),
+            reverse_bar=pygame.Color("red"),
+            text=pygame.Color(0, 0, 0),
+        ),
+        Palette(
+            background=pygame.Color("white"),
+            snake_head=pygame.Color("purple"),
+            snake_tail=pygame.Color("red"),
+            food=pygame.Color("blue"),
+            bar_background=pygame.Color("black"),
+            reverse_bar=pygame.Color("green"),
+            text=pygame.Color(255, 255, 255),
+        ),
+    )
 
     def __init__(self, screen: pygame.Surface):
         self._screen = screen
         self._score_font = pygame.font.Font(pygame.font.match_font('arial'), 18)
         self._game_over_font = pygame.font.Font(pygame.font.match_font('arial'), 48)
+
+        sounds_directory = Path(__file__).parent / 'sounds'
+        self._sounds = GameSounds(
+            reverse=pygame.mixer.Sound(str(sounds_directory / 'tape_rewind.ogg')),
+            food=pygame.mixer.Sound(str(sounds_directory / 'profit.wav')),
+            fail=pygame.mixer.Sound(str(sounds_directory / 'fail.wav')),
+        )
+
+        # everything that doesn't change between frames is prepared once:
+        self._bar_rect = pygame.Rect(0, 0, self.BORDER_WIDTH, self.BAR_SIZE)
+        bar_left, bar_top = 25, 7
+        bar_height = 20
+        border_size = self.BAR_BORDER_SIZE
+        self._bar_border_width = border_size - 1
+        self._bar_border_rect = pygame.Rect(bar_left, bar_top, 100 + border_size, bar_height + border_size)
+        self._reverse_bar_rect = pygame.Rect(
+            bar_left + (border_size // 2), bar_top + (border_size // 2), 0, bar_height,
+        )
+        # prepared for each palette:
+        self._score_labels = tuple(self._score_font.render('Score: ', True, palette.text) for palette in self.PALETTES)
+        self._score_digits = tuple(
+            tuple(self._score_font.render(digit, True, palette.text) for digit in '0123456789')
+            for palette in self.PALETTES
+        )
+        self._snake_head_surfaces = tuple(self._make_part_surface(palette.snake_head) for palette in self.PALETTES)
+        self._snake_tail_surfaces = tuple(self._make_part_surface(palette.snake_tail) for palette in self.PALETTES)
+
         self._frame_time = GameDifficulty.NORMAL.value
         self._is_predictable_future = False
+        self._last_frame_state = None
 
     def set_difficulty(self, __, difficulty: GameDifficulty) -> None:
         self._frame_time = difficulty.value
@@ -238,11 +393,13 @@ class Game:
         self._is_predictable_future = is_destiny
 
     def run(self) -> None:
+        self._last_frame_state = None  # the first frame of a session is always drawn fully
         game_area = GameArea(left=0, top=self.BAR_SIZE, width=self.BORDER_WIDTH, height=self.BORDER_HEIGHT)
         game = GameSession(
             game_area=game_area,
             frame_time=self._frame_time,
             is_predictable_future=self._is_predictable_future,
+            sounds=self._sounds,
         )
         while True:
             for event in pygame.event.get():
@@ -253,68 +410,93 @@ class Game:
                         return
 
                     game.handle_keypress(event.key)
+                if event.type == pygame.KEYUP:
+                    game.handle_keyrelease(event.key)
+                if event.type == GameSession.FOOD_SOUND_END_EVENT:
+                    game.handle_food_sound_end()
 
             pygame.time.delay(self._frame_time)
             if game.is_running:
                 game.move_snake()
-                self._render_game_session(game)
+                changed_areas = self._render_game_session(game)
             else:
                 self._render_game_over()
-            pygame.display.flip()
+                changed_areas = None
+
+            if changed_areas is None:
+                pygame.display.flip()
+            else:
+                pygame.display.update(changed_areas)
 
-    def _render_game_session(self, game: GameSession) -> None:
+    def _render_game_session(self, game: GameSession) -> Optional[List[pygame.Rect]]:
+        """
+        Draws current frame of a game session.
+
+        Returns areas of the screen which were changed since the previous frame, or None if all the screen was redrawn.
+        """
         screen = self._screen
-        if game.is_reversed:
-            background_color = "white"
-            snake_head_color = "purple"
-            snake_tail_color = "red"
-            food_color = "blue"
-
-            bar_bg_color = "black"
-            reverse_bar_color = "green"
-            text_color = (255, 255, 255)
+        palette = self.PALETTES[game.is_reversed]
+        snake = game.snake
+        head_surface = self._snake_head_surfaces[game.is_reversed]
+        tail_surface = self._snake_tail_surfaces[game.is_reversed]
+
+        # when the snake just moves forward, only its ends and the reverse bar change, so the rest of the screen
+        # (including the score) is kept:
+        frame_state = (game.is_reversed, game.score)
+        is_steady_frame = game.is_running and not game.is_reversed and frame_state == self._last_frame_state
+        self._last_frame_state = frame_state
+        if is_steady_frame:
+            screen.fill(palette.background, snake.vacated)
+            screen.blit(head_surface, snake.head)
+            screen.blits(((tail_surface, snake.parts[1]), (tail_surface, snake.parts[-1])), doreturn=False)
+            pygame.draw.rect(screen, palette.food, game.food)
+            pygame.draw.rect(screen, palette.bar_background, self._bar_border_rect, 0)
+            changed_areas = [snake.vacated, snake.parts[1], snake.head, game.food, self._bar_border_rect]
         else:
-            background_color = "black"
-            snake_head_color = "orange"
-            snake_tail_color = "green"
-            food_color = "yellow"
+            # draw background:
+            screen.fill(palette.background)
 
-            bar_bg_color = "white"
-            reverse_bar_color = "red"
-            text_color = (0, 0, 0)
+            # draw snake, all parts at once:
+            screen.blit(head_surface, snake.head)
+            screen.blits(((tail_surface, part) for part in snake.tail), doreturn=False)
 
-        # draw background:
-        screen.fill(background_color)
+            # draw food:
+            pygame.draw.rect(screen, palette.food, game.food)
 
-        # draw snake:
-        pygame.draw.rect(screen, snake_head_color, game.snake.head)
-        for part in game.snake.tail:
-            pygame.draw.rect(screen, snake_tail_color, part)
+            # draw bar section:
+            pygame.draw.rect(screen, palette.bar_background, self._bar_rect, 0)
+            self._render_score(game.score, game.is_reversed)
+            changed_areas = None
 
-        # draw food:
-        pygame.draw.rect(screen, food_color, game.food)
-
-        # draw bar section:
-        pygame.draw.rect(screen, bar_bg_color, (0, 0, self.BORDER_WIDTH, self.BAR_SIZE), 0)
-        bar_left, bar_top = 25, 7
-        bar_height = 20
-        bar_border_size = 4
-        pygame.draw.rect(
-            screen,
-            "grey",
-            (bar_left, bar_top, 100 + bar_border_size, bar_height + bar_border_size),
-            bar_border_size - 1,
-        )
+        pygame.draw.rect(screen, self.BAR_BORDER_COLOR, self._bar_border_rect, self._bar_border_width)
+        reverse_bar_rect = self._reverse_bar_rect
+        reverse_bar_rect.width = game.reverse_percent
         pygame.draw.rect(
             screen,
-            "grey" if game.is_full_reversed else reverse_bar_color,
-            (bar_left + (bar_border_size / 2), bar_top + (bar_border_size / 2), game.reverse_percent, bar_height),
+            self.BAR_BORDER_COLOR if game.is_full_reversed else palette.reverse_bar,
+            reverse_bar_rect,
         )
 
-        score_surface = self._score_font.render(f'Score: {game.score}', True, text_color)
-        score_rect = score_surface.get_rect()
-        score_rect.midtop = self.BORDER_WIDTH - 100, 10
-        screen.blit(score_surface, score_rect)
+        return changed_areas
+
+    def _render_score(self, score: int, is_reversed: bool) -> None:
+        """Composes the score from prepared surfaces of the label and digits, so no text is rendered."""
+        label_surface = self._score_labels[is_reversed]
+        digit_surfaces = self._score_digits[is_reversed]
+        surfaces = [label_surface]
+        surfaces.extend(digit_surfaces[int(digit)] for digit in str(score))
+
+        left = self.BORDER_WIDTH - 100 - sum(surface.get_width() for surface in surfaces) // 2
+        blit_sequence = []
+        for surface in surfaces:
+            blit_sequence.append((surface, (left, 10)))
+            left += surface.get_width()
+        self._screen.blits(blit_sequence, doreturn=False)
+
+    def _make_part_surface(self, color: pygame.Color) -> pygame.Surface:
+        surface = pygame.Surface((Snake.PART_SIZE, Snake.PART_SIZE)).convert(self._screen)
+        surface.fill(color)
+        return surface
 
     def _render_game_over(self) -> None:
         text_surface = self._game_over_font.render(f'GAME OVER', True, (255, 0, 0))